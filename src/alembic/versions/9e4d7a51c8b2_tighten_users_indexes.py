@@ -0,0 +1,29 @@
+"""drop redundant users id index and require email
+
+Revision ID: 9e4d7a51c8b2
+Revises: 6b1f3c2a9d10
+Create Date: 2026-10-15 08:34:47.486133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4d7a51c8b2'
+down_revision: Union[str, None] = '6b1f3c2a9d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The primary key already has its own index, ix_users_id only slowed down inserts.
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.alter_column("users", "email", existing_type=sa.String(), nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column("users", "email", existing_type=sa.String(), nullable=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
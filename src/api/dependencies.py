@@ -2,10 +2,21 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from src.services.auth_service import AuthService
+from src.services.auth_service import AuthService, auth_service
 from src.utils.auth_jwt import CheckHTTPBearer
 from src.utils.unitofwork import UnitOfWork, ABCUnitOfWork
 
 UOWDep = Annotated[ABCUnitOfWork, Depends(UnitOfWork)]
 AuthServiceDep = Annotated[AuthService, Depends(AuthService)]
 JWTTokenDep = Annotated[str | None, Depends(CheckHTTPBearer())]
+
+
+def get_current_email(token: JWTTokenDep) -> str:
+    """Verify the bearer token once per request without touching the database.
+
+    Services load the user inside their own unit of work, so each request uses a single session.
+    """
+    return auth_service.verify_access_token(token)
+
+
+CurrentEmailDep = Annotated[str, Depends(get_current_email)]
@@ -1,8 +1,7 @@
 from fastapi import APIRouter
 from starlette import status
 
-from src.api.dependencies import UOWDep, AuthServiceDep, JWTTokenDep
-from src.models.users import User
+from src.api.dependencies import UOWDep, AuthServiceDep, CurrentEmailDep
 from src.schemas.auth import (
     ResetPasswordConfirmSchema,
     ResetPasswordSchema,
@@ -10,7 +9,6 @@ from src.schemas.auth import (
     OneTokenSchema
 )
 from src.schemas.users import (
-    SchemeConfirmRegistration,
     SchemeRegisterUser,
     SchemeLoginUser,
 )
@@ -42,7 +40,7 @@ async def register(uow: UOWDep, user: SchemeRegisterUser, auth_service: AuthServ
 @router.post("/verification_email")
 async def verification_email(
         uow: UOWDep,
-        token: SchemeConfirmRegistration,
+        token: OneTokenSchema,
         auth_service: AuthServiceDep
 ):
     """
@@ -52,7 +50,7 @@ async def verification_email(
     If the token is valid and corresponds to an existing user, the user's email status will be updated to confirmed.
 
     Args:
-        token (SchemeConfirmRegistration): The schema containing the confirmation token
+        token (OneTokenSchema): The schema containing the confirmation token
                                                                 and any necessary user details for the confirmation.
         uow (UOWDep): Dependency for unit of work management, facilitating database operations during the confirmation.
         auth_service (AuthService): Service for managing authentication operations.
@@ -85,7 +83,7 @@ async def password_reset(
     uow: UOWDep,
     reset_password: ResetPasswordSchema,
     auth_service: AuthServiceDep,
-    jwt_token: JWTTokenDep,
+    current_email: CurrentEmailDep,
 ):
     """
     Reset the password for a user.
@@ -98,12 +96,12 @@ async def password_reset(
         reset_password (SchemeResetPassword): The schema containing the user's email address for the password reset.
         uow (UOWDep): Dependency for unit of work management, which handles database transactions.
         auth_service (AuthService): Service for managing authentication operations.
-        jwt_token (User): The currently authenticated user.
+        current_email (str): The email of the currently authenticated user.
 
     Returns:
         dict: A response indicating that the password reset email has been sent.
     """
-    return await auth_service.reset_password(uow, reset_password.email, jwt_token)
+    return await auth_service.reset_password(uow, reset_password.email, current_email)
 
 
 @router.post("/password_reset/confirm", status_code=status.HTTP_201_CREATED)
@@ -111,7 +109,7 @@ async def reset_password_confirm(
     uow: UOWDep,
     data: ResetPasswordConfirmSchema,
     auth_service: AuthServiceDep,
-    jwt_token: JWTTokenDep,
+    current_email: CurrentEmailDep,
 ):
     """
     Confirm the password reset with the provided token and new password.
@@ -120,12 +118,12 @@ async def reset_password_confirm(
         data (ResetPassword): Contains the user's email, new password, and reset token.
         uow (UOWDep): Dependency for unit of work management.
         auth_service (AuthService): Service for managing authentication operations.
-        jwt_token (User): The currently authenticated user.
+        current_email (str): The email of the currently authenticated user.
 
     Returns:
         dict: A response indicating that the password has been successfully reset.
     """
-    await auth_service.reset_confirm_password(uow, data.token, data.new_password, jwt_token)
+    await auth_service.reset_confirm_password(uow, data.token, data.new_password, current_email)
 
 
 @router.post("/change_email", status_code=status.HTTP_200_OK)
@@ -133,7 +131,7 @@ async def change_email(
     email_data: EmailChangeSchema,
     uow: UOWDep,
     auth_service: AuthServiceDep,
-    jwt_token: JWTTokenDep,
+    current_email: CurrentEmailDep,
 ):
     """
     Initiate the email change process for the user.
@@ -142,12 +140,12 @@ async def change_email(
         email_data (EmailSchema): Contains the user's current and new email.
         uow (UOWDep): Dependency for unit of work management.
         auth_service (AuthService): Service for managing authentication operations.
-        jwt_token (User): The currently authenticated user.
+        current_email (str): The email of the currently authenticated user.
 
     Returns:
         dict: A response indicating that the email change request has been sent.
     """
-    return await auth_service.change_email(uow, email_data, jwt_token)
+    return await auth_service.change_email(uow, email_data, current_email)
 
 
 @router.post("/confirm_email_change", status_code=status.HTTP_200_OK)
@@ -155,7 +153,7 @@ async def confirm_email_change(
     data: OneTokenSchema,
     uow: UOWDep,
     auth_service: AuthServiceDep,
-    jwt_token: JWTTokenDep,
+    current_email: CurrentEmailDep,
 ):
     """
     Confirm the email change using the provided token.
@@ -164,9 +162,9 @@ async def confirm_email_change(
         data (OneTokenSchema): The token received in the email, containing old and new email addresses.
         uow (UOWDep): Dependency for unit of work management.
         auth_service (AuthService): Service for managing authentication operations.
-        jwt_token (User): The currently authenticated user.
+        current_email (str): The email of the currently authenticated user.
 
     Returns:
         dict: A response message indicating success or failure.
     """
-    return await auth_service.confirm_change_email(uow, data.token, jwt_token)
+    return await auth_service.confirm_change_email(uow, data.token, current_email)
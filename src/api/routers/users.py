@@ -1,9 +1,8 @@
 from fastapi import APIRouter
 
-from src.models.users import User
 from src.schemas.users import UserInDB
 from src.services.users_service import user_service
-from src.api.dependencies import UOWDep, JWTTokenDep
+from src.api.dependencies import UOWDep, CurrentEmailDep
 
 router = APIRouter(
     prefix="/users",
@@ -11,16 +10,16 @@ router = APIRouter(
 )
 
 
-@router.get("/{user_id}", response_model=UserInDB)
-async def read_user(uow: UOWDep, user_id: int, jwt_token: JWTTokenDep):
+@router.get("/{user_id}", response_model=None, responses={200: {"model": UserInDB}})
+async def read_user(uow: UOWDep, user_id: int, current_email: CurrentEmailDep) -> UserInDB:
     """Retrieve a user by their ID.
 
     Args:
         user_id (int): ID of the user.
         uow (UOWDep): Dependency for the unit of work.
-        jwt_token (User): The current user, must be an admin.
+        current_email (str): The email of the currently authenticated user.
 
     Returns:
-        UserResponse: Response containing user data.
+        UserInDB: Response containing user data, already validated by the service.
     """
-    return await user_service.get_user_by_id(uow, user_id, jwt_token)
+    return await user_service.get_user_by_id(uow, user_id, current_email)
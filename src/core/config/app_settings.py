@@ -1,4 +1,26 @@
-class AppSettings:
-    HOST = "0.0.0.0"
-    PORT = 8090
-    RELOAD = True
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AppSettings(BaseSettings):
+    HOST: str = "0.0.0.0"
+    PORT: int = 8090
+    RELOAD: bool = True
+    # Set APP_WORKERS above 1 to serve from several processes; reload only works with one worker.
+    # Every worker has its own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW connections), so keep
+    # WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) under Postgres' max_connections. The token, password
+    # and user caches, the SMTP connection and the email queue are per process too: a worker only
+    # reuses what it verified or loaded itself, and queued emails are lost if that worker dies.
+    WORKERS: int = 1
+    ACCESS_LOG: bool = False
+
+    model_config = SettingsConfigDict(env_prefix="APP_", env_file=".env", env_file_encoding="utf-8", extra="ignore")
+
+
+@lru_cache(maxsize=1)
+def get_app_settings() -> AppSettings:
+    return AppSettings()
+
+
+app_settings = get_app_settings()
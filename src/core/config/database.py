@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,12 +10,30 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
     POSTGRES_DB: str
     SECRET_KEY: str
+    BCRYPT_ROUNDS: int = 10
+    # Seconds a successful login lets the same password skip bcrypt in this process; 0 disables it.
+    # It trades away part of the hash's brute-force cost, so enable it only if bcrypt load demands it.
+    PASSWORD_CACHE_TTL: int = 0
+    DEBUG: bool = False
+    APP_BASE_URL: str = "http://localhost:8090"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    # Per-connection asyncpg prepared statement cache, set to 0 behind pgbouncer in transaction mode.
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512
+    DB_QUERY_CACHE_SIZE: int = 1200
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="allow")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,8 +8,19 @@ class SMTPSettings(BaseSettings):
     SMTP_PORT: int = 587
     SMTP_EMAIL: str
     SMTP_PASSWORD: str
+    SMTP_MAX_RATE: float = 5.0
+    SMTP_MAX_RETRIES: int = 3
+    SMTP_QUEUE_SIZE: int = 1000
+    # The shared connection is replaced after this many messages or this many idle seconds.
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_IDLE_TIMEOUT: float = 100
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="allow")
 
 
-smtp_settings = SMTPSettings()
+@lru_cache(maxsize=1)
+def get_smtp_settings() -> SMTPSettings:
+    return SMTPSettings()
+
+
+smtp_settings = get_smtp_settings()
@@ -1,5 +1,26 @@
 from loguru import logger
 
-logger.add("app.log", format="{time} {level} {message}", level="INFO")
+from src.core.config.database import settings
 
-__all__ = ["logger"]
+_file_sink_id: int | None = None
+
+
+def configure_logger() -> None:
+    """
+    Register the application file sink once; DEBUG records are only kept when `settings.DEBUG` is on.
+
+    Records are enqueued and written by a background thread, so request handlers never block on file I/O.
+    """
+    global _file_sink_id
+    if _file_sink_id is None:
+        _file_sink_id = logger.add(
+            "app.log",
+            format="{time} {level} {message}",
+            level="DEBUG" if settings.DEBUG else "INFO",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+        )
+
+
+__all__ = ["logger", "configure_logger"]
@@ -1,10 +1,25 @@
+import asyncio
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from src.core.config.database import settings
 
-engine = create_async_engine(settings.database_url, future=True, echo=True)
-async_session_maker = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.DEBUG,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+)
+async_session_maker = async_sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine, class_=AsyncSession
+)
 
 
 class Base(DeclarativeBase):
@@ -14,3 +29,13 @@ class Base(DeclarativeBase):
 async def get_async_session() -> AsyncSession:
     async with async_session_maker() as session:
         yield session
+
+
+async def warm_up_pool() -> None:
+    """Open `DB_POOL_SIZE` connections up front so first requests don't pay the connect cost."""
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(settings.DB_POOL_SIZE)))
@@ -3,25 +3,28 @@ from typing import Any
 from starlette import status
 
 
-class ObjectNotFound(Exception):
-    def __init__(self, model_name: str, id_: Any) -> None:
-        self.msg = f"{model_name} with given identifier - {id_} not found."
-        self.status_code = status.HTTP_404_NOT_FOUND
+class AppError(Exception):
+    """Base class for errors returned to the client as `{"message": msg}` with `status_code`."""
+
+    def __init__(self, msg: str, status_code: int) -> None:
+        self.msg = msg
+        self.status_code = status_code
         super().__init__(self.msg)
 
 
-class ObjectAlreadyExists(Exception):
+class ObjectNotFound(AppError):
+    def __init__(self, model_name: str, id_: Any) -> None:
+        super().__init__(f"{model_name} with given identifier - {id_} not found.", status.HTTP_404_NOT_FOUND)
+
+
+class ObjectAlreadyExists(AppError):
     def __init__(self, model_name: str, attr: str) -> None:
-        self.msg = f"{model_name} with given attribute: {attr} already exists."
-        self.status_code = status.HTTP_409_CONFLICT
-        super().__init__(self.msg)
+        super().__init__(f"{model_name} with given attribute: {attr} already exists.", status.HTTP_409_CONFLICT)
 
 
-class EmailSendError(Exception):
+class EmailSendError(AppError):
     def __init__(self, email: str, action: str = "send email"):
-        self.msg = f"Failed to {action} to {email}. Please try again."
-        self.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        super().__init__(self.msg)
+        super().__init__(f"Failed to {action} to {email}. Please try again.", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 class UserAlreadyExistsError(ObjectAlreadyExists):
@@ -35,40 +38,35 @@ class UserNotFoundError(ObjectNotFound):
         super().__init__("User", user_id)
 
 
-class AuthenticationError(Exception):
+class AuthenticationError(AppError):
     pass
 
 
 class InvalidCredentialsError(AuthenticationError):
     def __init__(self):
-        self.msg = "Invalid credentials provided for user."
-        self.status_code = status.HTTP_401_UNAUTHORIZED
-        super().__init__(self.msg)
+        super().__init__("Invalid credentials provided for user.", status.HTTP_401_UNAUTHORIZED)
 
 
 class EmailNotConfirmedError(AuthenticationError):
     def __init__(self):
-        self.msg = "Email address has not been confirmed."
-        self.status_code = status.HTTP_400_BAD_REQUEST
-        super().__init__(self.msg)
+        super().__init__("Email address has not been confirmed.", status.HTTP_400_BAD_REQUEST)
 
 
 class InvalidTokenError(AuthenticationError):
     def __init__(self):
-        self.msg = "The provided token is invalid or expired."
-        self.status_code = status.HTTP_400_BAD_REQUEST
-        super().__init__(self.msg)
+        super().__init__("The provided token is invalid or expired.", status.HTTP_400_BAD_REQUEST)
 
 
 class PasswordResetError(AuthenticationError):
     def __init__(self):
-        self.msg = "Failed to reset password. Please try again."
-        self.status_code = status.HTTP_400_BAD_REQUEST
-        super().__init__(self.msg)
+        super().__init__("Failed to reset password. Please try again.", status.HTTP_400_BAD_REQUEST)
 
 
 class UserNotAuthenticatedError(AuthenticationError):
     def __init__(self):
-        self.msg = "User is not authenticated. Please provide valid credentials."
-        self.status_code = status.HTTP_401_UNAUTHORIZED
-        super().__init__(self.msg)
+        super().__init__("User is not authenticated. Please provide valid credentials.", status.HTTP_401_UNAUTHORIZED)
+
+
+class PermissionDeniedError(AuthenticationError):
+    def __init__(self):
+        super().__init__("You are not allowed to perform this action.", status.HTTP_403_FORBIDDEN)
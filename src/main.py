@@ -1,20 +1,52 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from loguru import logger
 
 from src.api.main_routers import main_router
 from src.api.main_handlers import setup_handlers
-from src.core.config.app_settings import AppSettings
+from src.core.config.app_settings import app_settings
+from src.core.config.logger import configure_logger
+from src.db.db import engine, warm_up_pool
+from src.services.email_service import email_service
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    configure_logger()
+    await warm_up_pool()
+    await email_service.start_worker()
+    yield
+    await email_service.stop_worker()
+    await email_service.close()
+    await engine.dispose()
+    # Drain queued log messages once at shutdown rather than after every transaction.
+    await logger.complete()
+
 
-app = FastAPI(title="Authorisation via Email")
+def create_app() -> FastAPI:
+    """Build the application with its exception handlers and routes."""
+    app = FastAPI(title="Authorisation via Email", lifespan=lifespan, default_response_class=ORJSONResponse)
+    setup_handlers(app)
+    # Only bodies above 1 KiB are compressed, in practice the OpenAPI schema and docs.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    app.include_router(main_router)
+    return app
 
-setup_handlers(app)
 
-app.include_router(main_router)
+app = create_app()
 
 if __name__ == "__main__":
     uvicorn.run(
         "src.main:app",
-        host=AppSettings.HOST,
-        port=AppSettings.PORT,
-        reload=AppSettings.RELOAD,
+        host=app_settings.HOST,
+        port=app_settings.PORT,
+        workers=app_settings.WORKERS,
+        reload=app_settings.RELOAD and app_settings.WORKERS == 1,
+        access_log=app_settings.ACCESS_LOG,
+        loop="uvloop",
+        http="httptools",
     )
@@ -1,3 +1,5 @@
+from sqlalchemy.dialects.postgresql import insert
+
 from src.models.users import User
 from src.utils.repository import SQLAlchemyRepository
 
@@ -10,3 +12,13 @@ class UsersRepository(SQLAlchemyRepository):
     """
 
     model = User
+
+    async def add_or_none(self, data: dict) -> int | None:
+        """Insert a user unless the email is taken, in one round-trip and without a check-then-insert race.
+
+        Returns:
+            int | None: The new user's id, or None if a user with this email already exists.
+        """
+        stmt = insert(User).values(**data).on_conflict_do_nothing(index_elements=["email"]).returning(User.id)
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
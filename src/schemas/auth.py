@@ -1,4 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from src.schemas.users import NewPassword
+
+__all__ = ["OneTokenSchema", "ResetPasswordSchema", "ResetPasswordConfirmSchema", "EmailChangeSchema"]
 
 
 class OneTokenSchema(BaseModel):
@@ -10,6 +14,8 @@ class OneTokenSchema(BaseModel):
         email verification or password reset.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     token: str
 
 
@@ -21,6 +27,8 @@ class ResetPasswordSchema(BaseModel):
         email (EmailStr): The email address of the user requesting the password reset.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     email: EmailStr
 
 
@@ -29,11 +37,13 @@ class ResetPasswordConfirmSchema(BaseModel):
     Schema for confirming a password reset, containing the new password and token.
 
     Attributes:
-        new_password (str): The new password that the user wants to set.
+        new_password (str): The new password that the user wants to set, 8 to 128 characters long.
         token (str): The token received in the password reset email.
     """
 
-    new_password: str
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    new_password: NewPassword
     token: str
 
 
@@ -46,5 +56,7 @@ class EmailChangeSchema(BaseModel):
         new_email (EmailStr): The new email address the user wants to set.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     old_email: EmailStr
     new_email: EmailStr
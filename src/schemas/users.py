@@ -1,6 +1,21 @@
-from pydantic import BaseModel, EmailStr
+from typing import Annotated
 
-from src.utils import auth_jwt
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints
+
+# Length limits are enforced by pydantic-core itself, so oversized input never reaches bcrypt.
+# Passwords are deliberately not whitespace-stripped, that would change what the user typed.
+Password = Annotated[str, StringConstraints(max_length=128)]
+NewPassword = Annotated[str, StringConstraints(min_length=8, max_length=128)]
+
+__all__ = [
+    "Password",
+    "NewPassword",
+    "UserBase",
+    "UserResponse",
+    "SchemeLoginUser",
+    "SchemeRegisterUser",
+    "UserInDB",
+]
 
 
 class UserBase(BaseModel):
@@ -12,8 +27,10 @@ class UserBase(BaseModel):
         password (str): The user's plain text password.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     email: EmailStr
-    password: str
+    password: Password
 
 
 class UserResponse(BaseModel):
@@ -43,60 +60,30 @@ class SchemeLoginUser(UserBase):
 
 class SchemeRegisterUser(UserBase):
     """
-    Schema for user registration, with additional functionality for hashing the password.
-
-    Methods:
-        model_dump: Overrides BaseModel method to hash the password before storing.
+    Schema for user registration, inheriting from UserBase with a stricter password rule.
 
     Inherits:
         email (EmailStr): User's email.
-        password (str): User's password.
+        password (str): User's password, 8 to 128 characters long.
     """
 
-    def model_dump(self, *args, **kwargs):
-        """
-        Generate a dictionary representation of the model with hashed password.
-
-        Returns:
-            dict: Model data with hashed password field.
-        """
-        data = super().model_dump(*args, **kwargs)
-        data["hashed_password"] = auth_jwt.hash_password(data.pop("password"))
-        return data
+    password: NewPassword
 
 
-class UserInDB(UserBase):
+class UserInDB(BaseModel):
     """
-    Schema representing user data in the database, extending basic user fields with additional status fields.
+    Schema representing user data stored in the database, without any password material.
 
     Attributes:
         id (int): Unique identifier of the user.
+        email (EmailStr): User's email.
         is_active (bool): Status indicating if the user is active.
         is_email_confirmed (bool): Status indicating if the user's email is confirmed.
-
-    Inherits:
-        email (EmailStr): User's email.
-        password (str): User's password.
     """
 
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
+    email: EmailStr
     is_active: bool
     is_email_confirmed: bool
-
-    class Config:
-        """
-        Configuration class to enable ORM mode and attribute access.
-        """
-
-        from_attributes = True
-
-
-class SchemeConfirmRegistration(BaseModel):
-    """
-    Schema for confirming user registration.
-
-    Attributes:
-        token (str): The token used for registration confirmation.
-    """
-
-    token: str
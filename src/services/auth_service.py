@@ -1,8 +1,5 @@
-from fastapi import Depends
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jwt import PyJWTError
 
-from src.core.config.app_settings import AppSettings
 from src.core.config.database import settings
 from src.models.users import User
 from src.services.email_service import email_service
@@ -13,46 +10,50 @@ from src.exceptions.errors import (
     EmailNotConfirmedError,
     UserAlreadyExistsError,
     InvalidTokenError,
-    EmailSendError,
     UserNotAuthenticatedError,
+    PermissionDeniedError,
 )
 from src.schemas.users import SchemeRegisterUser
 from src.schemas.auth import EmailChangeSchema
-from src.utils.auth_jwt import CheckHTTPBearer
+from src.utils.cache import user_cache
 from src.utils.unitofwork import UnitOfWork, ABCUnitOfWork
 
 
 class AuthService:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    SECRET_KEY = settings.SECRET_KEY
-    ALGORITHM = "HS256"
+    BASE_URL = settings.APP_BASE_URL
 
     async def register_user(self, uow: UnitOfWork, user: SchemeRegisterUser):
         """
-        Adds a new user to the database.
+        Adds a new user to the database and mails them a confirmation link.
+
+        Registering an email that exists but was never confirmed mails a fresh confirmation link
+        for the existing account instead, so a lost or undelivered email can be recovered.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             user (SchemeRegisterUser): The schema containing user data to be added.
 
         Returns:
-            int: The ID of the newly added user.
+            int: The ID of the newly added or still unconfirmed user.
 
         Raises:
-            Exception: If a user with the provided email already exists.
+            UserAlreadyExistsError: If a confirmed user with the provided email already exists.
         """
-        user_dict = user.model_dump()
+        user_dict = user.model_dump(exclude={"password"})
+        user_dict["hashed_password"] = await auth_jwt.hash_password_async(user.password)
         async with uow:
-            if await uow.users.find_one_or_none(email=user_dict["email"]):
-                raise UserAlreadyExistsError(user_dict["email"])
-
-            user_id = await uow.users.add_one(user_dict)
-
-            confirm_token = auth_jwt.create_confirmation_token(user_dict["email"])
-            host = AppSettings.HOST
-            if not await email_service.confirm_email(confirm_token, user_dict["email"], host):
-                raise EmailSendError(email=user_dict["email"], action="send confirmation email")
-            return user_id
+            user_id = await uow.users.add_or_none(user_dict)
+            if user_id is None:
+                existing = await uow.users.find_one_or_none(email=user_dict["email"])
+                # The stored password is kept, so only the mailbox owner can finish this registration.
+                if existing is None or existing.is_email_confirmed:
+                    raise UserAlreadyExistsError(user_dict["email"])
+                user_id = existing.id
+
+        # Mailed only once the user is committed, so a link never points at a rolled back account.
+        confirm_token = auth_jwt.create_confirmation_token(user_dict["email"])
+        await email_service.confirm_email(confirm_token, user_dict["email"], self.BASE_URL, reg=True)
+        return user_id
 
     async def confirm_verification_email(self, uow: ABCUnitOfWork, token: str):
         """
@@ -72,18 +73,12 @@ class AuthService:
             raise InvalidTokenError
 
         async with uow:
-            user = await uow.users.find_one_or_none(email=email)
-
-            if not user:
+            user_id = await uow.users.update_one_or_none({"is_email_confirmed": True}, email=email)
+            if user_id is None:
                 raise InvalidCredentialsError
 
-            is_email_confirmed = True
-            data = {"is_email_confirmed": is_email_confirmed, "email": email}
-
-            await uow.users.update_one(user.id, data)
             await uow.commit()
-
-            return
+            user_cache.pop(user_id, None)
 
     async def login_user(self, uow: ABCUnitOfWork, email: str, password: str):
         """
@@ -105,22 +100,29 @@ class AuthService:
             if not user:
                 raise InvalidCredentialsError
 
-            if not auth_jwt.verify_password(password, user.hashed_password):
+            verified, new_hash = await auth_jwt.verify_and_update_password_async(password, user.hashed_password)
+            if not verified:
                 raise InvalidCredentialsError
 
             if not user.is_email_confirmed:
                 raise EmailNotConfirmedError
 
-            data = {"is_active": True}
-            await uow.users.update_one(user.id, data)
+            # Most logins change nothing, so only write when there is something to store.
+            data = {}
+            if not user.is_active:
+                data["is_active"] = True
+            if new_hash:
+                data["hashed_password"] = new_hash
+            if data:
+                await uow.users.update_one(user.id, data)
+                await uow.commit()
+                user_cache.pop(user.id, None)
 
             token_data = {"sub": user.email}
             access_token = auth_jwt.create_access_token(token_data)
-
-            await uow.commit()
             return {"access_token": access_token, "token_type": "bearer"}
 
-    async def reset_password(self, uow: UnitOfWork, email: str, jwt_token: str | None):
+    async def reset_password(self, uow: UnitOfWork, email: str, current_email: str):
         """
         Initiate the password reset process for a user.
 
@@ -130,28 +132,24 @@ class AuthService:
         Args:
             uow (UnitOfWork): The unit of work used for database transactions.
             email (str): The email address of the user requesting a password reset.
-            jwt_token (User): The currently authenticated user.
+            current_email (str): The email of the currently authenticated user.
 
         Returns:
             None: This method does not return a value.
 
         Raises:
+            UserNotAuthenticatedError: If the authenticated user no longer exists.
             UserNotFoundError: If no user with the given email exists.
         """
-        current_user = await self.get_current_user(jwt_token, uow)
-        if not current_user:
-            raise UserNotAuthenticatedError
-
         async with uow:
-            user = await uow.users.find_one_or_none(email=email)
-            if not user:
-                raise UserNotFoundError
+            await self._get_user_by_email(uow, current_email)
+            if email != current_email and not await uow.users.find_one_or_none(email=email):
+                raise UserNotFoundError(email)
 
-            reset_token = auth_jwt.create_reset_token(email)
-            host = AppSettings.HOST
-            await email_service.confirm_email(reset_token, email, host)
+        reset_token = auth_jwt.create_reset_token(email)
+        await email_service.confirm_email(reset_token, email, self.BASE_URL)
 
-    async def reset_confirm_password(self, uow: UnitOfWork, token: str, new_password: str, jwt_token: str | None):
+    async def reset_confirm_password(self, uow: UnitOfWork, token: str, new_password: str, current_email: str):
         """
         Confirm the password reset and update it in the database.
 
@@ -159,133 +157,118 @@ class AuthService:
             uow (UnitOfWork): The unit of work instance for database transactions.
             token (str): The reset token sent to the user's email.
             new_password (str): The new password to be set for the user.
-            jwt_token (User): The currently authenticated user.
+            current_email (str): The email of the currently authenticated user.
 
         Returns:
             None: This method does not return a value.
 
         Raises:
             InvalidTokenError: If the token is invalid or expired.
+            UserNotAuthenticatedError: If the authenticated user no longer exists.
             UserNotFoundError: If the user associated with the token does not exist.
         """
-        current_user = await self.get_current_user(jwt_token, uow)
-        if not current_user:
-            raise UserNotAuthenticatedError
-
-        email = auth_jwt.verify_confirmation_token(token)
+        email = auth_jwt.verify_reset_token(token)
         if email is None:
             raise InvalidTokenError
 
+        hashed_password = await auth_jwt.hash_password_async(new_password)
         async with uow:
-            user = await uow.users.find_one_or_none(email=email)
-            if not user:
-                raise UserNotFoundError
+            if email != current_email:
+                await self._get_user_by_email(uow, current_email)
+            user_id = await uow.users.update_one_or_none({"hashed_password": hashed_password}, email=email)
+            if user_id is None:
+                raise UserNotFoundError(email)
 
-            hashed_password = auth_jwt.hash_password(new_password)
-            data = {"hashed_password": hashed_password}
-            await uow.users.update_one(user.id, data)
             await uow.commit()
+            user_cache.pop(user_id, None)
 
-    async def change_email(self, uow: UnitOfWork, data: EmailChangeSchema, jwt_token: str | None):
+    async def change_email(self, uow: UnitOfWork, data: EmailChangeSchema, current_email: str):
         """
         Initiate the process to change the user's email address.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             data (str): The user's current email and new email.
-            jwt_token (User): The currently authenticated user.
+            current_email (str): The email of the currently authenticated user.
 
         Returns:
             None: This method does not return a value.
 
         Raises:
-            UserNotFoundError: If the user with the current email does not exist.
+            PermissionDeniedError: If the old email is not the current user's.
+            UserNotAuthenticatedError: If the authenticated user no longer exists.
         """
-        current_user = await self.get_current_user(jwt_token, uow)
-        if not current_user:
-            raise UserNotAuthenticatedError()
-
+        # The token is mailed to the new address, so only the account owner may request one.
+        if data.old_email != current_email:
+            raise PermissionDeniedError
         async with uow:
-            user = await uow.users.find_one_or_none(email=data.old_email)
-            if not user:
-                raise UserNotFoundError
+            await self._get_user_by_email(uow, current_email)
 
-            confirm_token = auth_jwt.create_change_email_token(data.old_email, data.new_email)
-            host = AppSettings.HOST
-            await email_service.confirm_email(confirm_token, data.new_email, host)
-            await uow.commit()
+        confirm_token = auth_jwt.create_change_email_token(data.old_email, data.new_email)
+        await email_service.confirm_email(confirm_token, data.new_email, self.BASE_URL)
 
-    async def confirm_change_email(self, uow: UnitOfWork, token: str, jwt_token: str | None):
+    async def confirm_change_email(self, uow: UnitOfWork, token: str, current_email: str):
         """
         Confirm the email change by validating the token and updating the user's email.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             token (str): The token containing old and new email addresses.
-            jwt_token (User): The currently authenticated user.
+            current_email (str): The email of the currently authenticated user.
 
         Returns:
             None: This method does not return a value.
 
         Raises:
-            InvalidTokenError: If the token is invalid or expired.
-            UserNotFoundError: If the user with the old email does not exist.
+            InvalidTokenError: If the token is invalid, expired or was issued for another user.
+            UserNotAuthenticatedError: If the authenticated user no longer exists.
         """
-        current_user = await self.get_current_user(jwt_token, uow)
-        if not current_user:
-            raise UserNotAuthenticatedError()
-
         email_data = auth_jwt.verify_change_email_token(token)
-        if not email_data:
+        if not email_data or email_data["old_email"] != current_email:
             raise InvalidTokenError
 
         old_email = email_data["old_email"]
         new_email = email_data["new_email"]
 
         async with uow:
-            user = await uow.users.find_one_or_none(email=old_email)
-            if not user:
-                raise UserNotFoundError
-
-            data = {"email": new_email}
-            await uow.users.update_one(user.id, data)
+            # old_email is the caller's own, so a miss means the authenticated user is gone.
+            user_id = await uow.users.update_one_or_none({"email": new_email}, email=old_email)
+            if user_id is None:
+                raise UserNotAuthenticatedError
 
             await uow.commit()
+            user_cache.pop(user_id, None)
 
-    async def get_current_user(
-        self,
-        token: str = Depends(CheckHTTPBearer),
-        uow: UnitOfWork = Depends(UnitOfWork),
-    ) -> User:
+    @staticmethod
+    def verify_access_token(token: str) -> str:
         """
-        Retrieve the current user based on the provided JWT token.
+        Verify an access token without touching the database.
 
         Args:
             token (str): The JWT token from the request.
-            uow (UnitOfWork): The unit of work instance for database transactions.
 
         Returns:
-            User: The currently authenticated user.
+            str: The email of the user the token was issued to.
 
         Raises:
-            UserNotAuthenticatedError: If the token is invalid or the user is not found.
+            UserNotAuthenticatedError: If the token is invalid, expired or not an access token.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
-            if payload.get("scope") == "access_token":
-                email = payload.get("sub")
-                if email is None:
-                    raise UserNotAuthenticatedError
-            else:
-                raise UserNotAuthenticatedError
-        except JWTError:
+            payload = auth_jwt.decode_jwt(token)
+        except PyJWTError:
             raise UserNotAuthenticatedError
+        email = payload.get("sub")
+        if payload.get("scope") != auth_jwt.ACCESS_SCOPE or email is None:
+            raise UserNotAuthenticatedError
+        return email
 
-        async with uow:
-            user = await uow.users.find_one_or_none(email=email)
-            if not user:
-                raise UserNotAuthenticatedError
-            return user
+    @staticmethod
+    async def _get_user_by_email(uow: ABCUnitOfWork, email: str) -> User:
+        """Load the authenticated user inside the caller's open unit of work."""
+        user = await uow.users.find_one_or_none(email=email)
+        if not user:
+            raise UserNotAuthenticatedError
+        return user
 
     async def decode_token(self, token: str) -> dict:
         """
@@ -301,9 +284,9 @@ class AuthService:
             HTTPException: If the token is invalid.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = auth_jwt.decode_jwt(token)
             return payload
-        except JWTError:
+        except PyJWTError:
             raise UserNotAuthenticatedError
 
 
@@ -1,10 +1,23 @@
-import smtplib
+import asyncio
+import contextlib
+import time
 from email.mime.text import MIMEText
 from typing import List
+
+import aiosmtplib
 from loguru import logger
 
 from src.core.config.email import smtp_settings
 
+# Subject and body template of the confirmation emails, keyed by the `reg` flag of `confirm_email`.
+_CONFIRM_TEMPLATES = {
+    True: (
+        "Confirmation of Registration",
+        "To confirm your registration, follow the link:\n%s/confirmation_of_registration/%s",
+    ),
+    False: ("Password Reset", "To reset your password, follow the link:\n%s/reset_password/%s"),
+}
+
 
 class EmailService:
     def __init__(self):
@@ -12,34 +25,151 @@ class EmailService:
         self.smtp_port = smtp_settings.SMTP_PORT
         self.email = smtp_settings.SMTP_EMAIL
         self.password = smtp_settings.SMTP_PASSWORD
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._lock = asyncio.Lock()
+        self._sent_on_connection = 0
+        self._last_used = 0.0
+        self._queue: asyncio.Queue[tuple[str, str, List[str], int]] = asyncio.Queue(smtp_settings.SMTP_QUEUE_SIZE)
+        self._worker: asyncio.Task | None = None
+
+    async def _get_connection(self) -> aiosmtplib.SMTP:
+        """
+        Return the shared authenticated SMTP connection, opening it on first use.
 
-    def send_email(self, subject: str, body: str, recipients: List[str]) -> bool:
+        The connection is replaced once it has sent `SMTP_MAX_MESSAGES_PER_CONNECTION` messages or has been
+        idle for `SMTP_IDLE_TIMEOUT` seconds, before the server gets a chance to drop it mid-send.
+        """
+        if self._smtp is not None and (
+            self._sent_on_connection >= smtp_settings.SMTP_MAX_MESSAGES_PER_CONNECTION
+            or time.monotonic() - self._last_used > smtp_settings.SMTP_IDLE_TIMEOUT
+        ):
+            with contextlib.suppress(aiosmtplib.SMTPException):
+                await self._smtp.quit()
+            self._smtp = None
+        if self._smtp is None or not self._smtp.is_connected:
+            smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=True)
+            await smtp.connect()
+            await smtp.login(self.email, self.password)
+            self._smtp = smtp
+            self._sent_on_connection = 0
+        return self._smtp
+
+    async def close(self) -> None:
+        """Close the shared SMTP connection if it is open."""
+        async with self._lock:
+            if self._smtp is not None and self._smtp.is_connected:
+                await self._smtp.quit()
+            self._smtp = None
+
+    async def _send(self, msg: MIMEText, recipients: List[str]) -> None:
+        """Send a message over the shared connection; the caller must hold the lock."""
+        try:
+            smtp = await self._get_connection()
+            await smtp.send_message(msg, sender=self.email, recipients=recipients)
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection, reconnect once and retry.
+            self._smtp = None
+            smtp = await self._get_connection()
+            await smtp.send_message(msg, sender=self.email, recipients=recipients)
+        self._sent_on_connection += 1
+        self._last_used = time.monotonic()
+
+    async def send_email(self, subject: str, body: str, recipients: List[str]) -> bool:
         msg = MIMEText(body)
         msg["Subject"] = subject
         msg["From"] = self.email
         msg["To"] = ", ".join(recipients)
-        logger.debug(f"Sending {subject} email to {', '.join(recipients)}")
+        logger.opt(lazy=True).debug("Sending {} email to {}", lambda: subject, lambda: ", ".join(recipients))
 
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as smtp:
-                smtp.ehlo()
-                smtp.starttls()
-                smtp.login(self.email, self.password)
-                smtp.sendmail(from_addr=self.email, to_addrs=recipients, msg=msg.as_string())
+            async with self._lock:
+                await self._send(msg, recipients)
             logger.info("Email sent successfully.")
             return True
         except Exception as e:
-            logger.exception(f"Failed to send email: {e}")
+            logger.exception("Failed to send email: {}", e)
             return False
 
-    async def confirm_email(self, reset_token: str, email: str, host: str, reg: bool = False) -> bool:
-        logger.info(f"{'Confirm reg' if reg else 'Send'} email to {email}, {reset_token=}")
-        subject = "Confirmation of Registration" if reg else "Password Reset"
-        url = f"{host}/confirmation_of_registration/{reset_token}" if reg else f"{host}/reset_password/{reset_token}"
-        body = f"To {'confirm your registration' if reg else 'reset your password'}, follow the link:\n{url}"
+    async def send_bulk(self, subject: str, body: str, recipients: List[str]) -> int:
+        """
+        Send the same email to every recipient individually over one SMTP connection.
+
+        The message is built once and only its To header changes per recipient.
+
+        Returns:
+            int: The number of recipients the email was delivered to.
+        """
+        msg = MIMEText(body)
+        msg["Subject"] = subject
+        msg["From"] = self.email
+        logger.debug("Sending {} email to {} recipients", subject, len(recipients))
+
+        sent = 0
+        async with self._lock:
+            for recipient in recipients:
+                del msg["To"]
+                msg["To"] = recipient
+                try:
+                    await self._send(msg, [recipient])
+                    sent += 1
+                except Exception as e:
+                    logger.exception("Failed to send email to {}: {}", recipient, e)
+        return sent
+
+    async def start_worker(self) -> None:
+        """Start the background task that delivers queued emails."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run_worker())
+
+    async def stop_worker(self, timeout: float = 10) -> None:
+        """Give queued emails up to `timeout` seconds to go out, then stop the worker."""
+        if self._worker is None:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), timeout)
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
+
+    async def _run_worker(self) -> None:
+        interval = 1 / smtp_settings.SMTP_MAX_RATE
+        while True:
+            subject, body, recipients, attempt = await self._queue.get()
+            try:
+                if not await self.send_email(subject, body, recipients) and attempt < smtp_settings.SMTP_MAX_RETRIES:
+                    delay = 2**attempt
+                    logger.warning("Retrying {} email in {}s (attempt {})", subject, delay, attempt + 1)
+                    asyncio.get_running_loop().call_later(
+                        delay, self._requeue, (subject, body, recipients, attempt + 1)
+                    )
+            finally:
+                self._queue.task_done()
+            await asyncio.sleep(interval)
 
-        recipients = [email]
-        return self.send_email(subject, body, recipients)
+    def _requeue(self, item: tuple[str, str, List[str], int]) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.error("Email queue is full, dropping retry of {} email to {}", item[0], ", ".join(item[2]))
+
+    async def enqueue_email(self, subject: str, body: str, recipients: List[str]) -> bool:
+        """
+        Hand an email over to the background worker.
+
+        Falls back to sending inline when the worker is not running (e.g. outside the app lifespan)
+        or when the queue is full, so a backlog slows callers down instead of growing without bound.
+        """
+        if self._worker is None or self._worker.done() or self._queue.full():
+            return await self.send_email(subject, body, recipients)
+        self._queue.put_nowait((subject, body, recipients, 0))
+        return True
+
+    async def confirm_email(self, reset_token: str, email: str, host: str, reg: bool = False) -> bool:
+        # The token grants access to the account, so it must never reach the logs.
+        logger.info("{} email to {}", "Confirm reg" if reg else "Send", email)
+        subject, body_template = _CONFIRM_TEMPLATES[reg]
+        return await self.enqueue_email(subject, body_template % (host, reset_token), [email])
 
 
 email_service = EmailService()
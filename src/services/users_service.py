@@ -1,32 +1,52 @@
 from src.exceptions.errors import UserNotFoundError, UserNotAuthenticatedError
+from src.models.users import User
+from src.schemas.users import UserInDB
+from src.utils.cache import user_cache
 from src.utils.unitofwork import UnitOfWork
 
 
 class UsersService:
-    async def get_user_by_id(self, uow: UnitOfWork, user_id: int, jwt_token: str | None):
+    async def get_user_by_id(self, uow: UnitOfWork, user_id: int, current_email: str) -> UserInDB:
         """
-        Retrieves a user by their ID.
+        Retrieves a user by their ID, serving it from the short-lived user cache when possible.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             user_id (int): The ID of the user to be retrieved.
-            jwt_token (User): The currently authenticated user.
+            current_email (str): The email of the currently authenticated user.
 
         Returns:
-            UserResponse: The user data.
+            UserInDB: The user data.
 
         Raises:
-            Exception: If the user with the specified ID is not found.
+            UserNotAuthenticatedError: If the authenticated user no longer exists.
+            UserNotFoundError: If the user with the specified ID is not found.
         """
-        current_user = await self.get_current_user(jwt_token, uow)
-        if not current_user:
-            raise UserNotAuthenticatedError
-
         async with uow:
-            user = await uow.users.find_one(id=user_id)
+            current_user = await uow.users.find_one_or_none(email=current_email)
+            if not current_user:
+                raise UserNotAuthenticatedError
+            # The caller's own row has just been loaded, no need to fetch it again.
+            if current_user.id == user_id:
+                return self._to_user_in_db(current_user)
+            if cached := user_cache.get(user_id):
+                return cached
+
+            user = await uow.users.find_by_id(user_id)
             if not user:
-                raise UserNotFoundError
-            return user
+                raise UserNotFoundError(user_id)
+            user_cache[user_id] = user_in_db = self._to_user_in_db(user)
+            return user_in_db
+
+    @staticmethod
+    def _to_user_in_db(user: User) -> UserInDB:
+        """Build the response schema from a row of our own table, skipping re-validation."""
+        return UserInDB.model_construct(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            is_email_confirmed=user.is_email_confirmed,
+        )
 
 
 user_service = UsersService()
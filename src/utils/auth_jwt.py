@@ -1,17 +1,62 @@
-from datetime import datetime, timedelta
-
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from cachetools import TLRUCache, TTLCache
 from fastapi import Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
 
 from src.core.config.database import settings
 from src.exceptions.errors import UserNotAuthenticatedError
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with any other cost are rewritten by verify_and_update_password on the next login.
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
 
-SECRET_KEY = settings.SECRET_KEY
+# Encoded once; PyJWT and hmac would otherwise encode the str key on every call.
+SECRET_KEY = settings.SECRET_KEY.encode()
 ALGORITHM = "HS256"
+# Built once and shared by every decode call.
+ALGORITHMS = (ALGORITHM,)
+DECODE_OPTIONS = {"verify_aud": False, "require": ["exp", "sub"]}
+
+# Every token carries the purpose it was minted for, and each verifier only accepts its own.
+ACCESS_SCOPE = "access_token"
+CONFIRM_SCOPE = "confirm_email"
+RESET_SCOPE = "reset_password"
+CHANGE_EMAIL_SCOPE = "change_email"
+
+
+def _token_ttu(_key: bytes, payload: dict, now: float) -> float:
+    """Keep a verified payload for at most a minute and never past its own expiry."""
+    return min(payload.get("exp", now), now + 60)
+
+
+# bcrypt runs here instead of the default executor, so slow hashes never starve other to_thread users.
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+# HMACs of (password, hash) pairs that verified recently, so repeated logins skip bcrypt. Only built when
+# PASSWORD_CACHE_TTL is set. Only successful checks are stored and the raw password never is. A password
+# change or reset stores a new hash, so entries for the old one can never match again and just expire.
+_verified_passwords: TTLCache | None = (
+    TTLCache(maxsize=10_000, ttl=settings.PASSWORD_CACHE_TTL) if settings.PASSWORD_CACHE_TTL > 0 else None
+)
+
+# Recently verified token payloads, keyed by the SHA-256 digest of the token.
+_token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode a password for bcrypt, which only ever uses the first 72 bytes.
+
+    passlib truncated silently, so hashes it produced stay verifiable; newer bcrypt releases reject longer input.
+    """
+    return password.encode()[:72]
 
 
 def hash_password(password: str) -> str:
@@ -25,7 +70,7 @@ def hash_password(password: str) -> str:
     Returns:
         str: The hashed password.
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -40,10 +85,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode())
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password and rehash it if its hash uses outdated settings.
+
+    Args:
+        plain_password (str): The plain-text password.
+        hashed_password (str): The hashed password to verify against.
 
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and a fresh hash to store
+        when the existing one is deprecated (e.g. hashed with a different number of rounds).
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    # A bcrypt hash reads "$2b$<cost>$<salt and checksum>".
+    if int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS:
+        return True, hash_password(plain_password)
+    return True, None
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a plain-text password in the dedicated bcrypt thread pool.
+
+    bcrypt is deliberately slow, so the hashing is kept off the event loop.
+
+    Args:
+        password (str): The plain-text password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, hash_password, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Run `verify_and_update_password` in the dedicated bcrypt thread pool.
+
+    When `PASSWORD_CACHE_TTL` is set, a pair that verified within that many seconds is accepted
+    from memory without running bcrypt again.
+
+    Args:
+        plain_password (str): The plain-text password.
+        hashed_password (str): The hashed password to verify against.
 
-def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
+    Returns:
+        tuple[bool, str | None]: Whether the password matches, and a replacement hash if one is needed.
+    """
+    loop = asyncio.get_running_loop()
+    if _verified_passwords is None:
+        return await loop.run_in_executor(_hash_pool, verify_and_update_password, plain_password, hashed_password)
+
+    key = hmac.new(SECRET_KEY, f"{plain_password}\0{hashed_password}".encode(), hashlib.sha256).digest()
+    if key in _verified_passwords:
+        return True, None
+    verified, new_hash = await loop.run_in_executor(
+        _hash_pool, verify_and_update_password, plain_password, hashed_password
+    )
+    if verified and new_hash is None:
+        _verified_passwords[key] = True
+    return verified, new_hash
+
+
+def create_access_token(data: dict, expires_in: int = 15 * 60, scope: str = ACCESS_SCOPE) -> str:
     """Create a new access token.
 
     Generates a JWT access token with the specified expiration time, storing
@@ -51,14 +157,14 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
 
     Args:
         data (dict): The data to encode within the token, typically user information.
-        expires_delta (timedelta, optional): The token's lifetime. Defaults to 15 minutes.
+        expires_in (int, optional): The token's lifetime in seconds. Defaults to 15 minutes.
+        scope (str, optional): What the token may be used for. Defaults to an access token.
 
     Returns:
         str: The generated JWT access token.
     """
-    to_encode = data.copy()
-    expire = datetime.utcnow() + expires_delta if expires_delta else datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire, "scope": "access_token"})
+    # An epoch int is what ends up in the token anyway, so skip the datetime round-trip.
+    to_encode = {**data, "exp": int(time.time()) + expires_in, "scope": scope}
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -76,8 +182,8 @@ def create_change_email_token(old_email: str, new_email: str) -> str:
     Returns:
         str: The generated JWT token for email change.
     """
-    data = {"old_email": old_email, "new_email": new_email}
-    return create_access_token(data, expires_delta=timedelta(hours=1))
+    data = {"sub": old_email, "old_email": old_email, "new_email": new_email}
+    return create_access_token(data, expires_in=60 * 60, scope=CHANGE_EMAIL_SCOPE)
 
 
 def create_confirmation_token(email: str) -> str:
@@ -91,7 +197,7 @@ def create_confirmation_token(email: str) -> str:
     Returns:
         str: The generated JWT token for email confirmation.
     """
-    return create_access_token({"sub": email}, expires_delta=timedelta(hours=1))
+    return create_access_token({"sub": email}, expires_in=60 * 60, scope=CONFIRM_SCOPE)
 
 
 def create_reset_token(email: str) -> str:
@@ -106,7 +212,49 @@ def create_reset_token(email: str) -> str:
     Returns:
         str: The generated JWT token for password reset.
     """
-    return create_access_token({"sub": email}, expires_delta=timedelta(minutes=15))
+    return create_access_token({"sub": email}, expires_in=15 * 60, scope=RESET_SCOPE)
+
+
+def decode_jwt(token: str) -> dict:
+    """Decode and verify a JWT, reusing recently verified payloads.
+
+    The signature is only checked on a cache miss; cached entries expire no later than the token itself.
+
+    Args:
+        token (str): The JWT token to decode.
+
+    Returns:
+        dict: The decoded token payload.
+
+    Raises:
+        PyJWTError: If the token is invalid or expired.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHMS, options=DECODE_OPTIONS)
+        _token_cache[key] = payload
+    return payload
+
+
+def decode_scoped_jwt(token: str, scope: str) -> dict | None:
+    """Decode a JWT and check that it was issued for `scope`.
+
+    Args:
+        token (str): The JWT token to decode.
+        scope (str): The scope the token must carry.
+
+    Returns:
+        dict | None: The decoded token payload, or None if the token is invalid,
+        expired or was issued for another purpose.
+    """
+    try:
+        payload = decode_jwt(token)
+    except PyJWTError:
+        return None
+    if payload.get("scope") != scope:
+        return None
+    return payload
 
 
 def verify_confirmation_token(token: str) -> str | None:
@@ -119,13 +267,24 @@ def verify_confirmation_token(token: str) -> str | None:
 
     Returns:
         str | None: The email address if verification is successful,
-        or None if the token is invalid or expired.
+        or None if the token is invalid, expired or not a confirmation token.
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
-    except JWTError:
-        return None
+    payload = decode_scoped_jwt(token, CONFIRM_SCOPE)
+    return payload and payload.get("sub")
+
+
+def verify_reset_token(token: str) -> str | None:
+    """Verify a password reset token.
+
+    Args:
+        token (str): The JWT token to verify.
+
+    Returns:
+        str | None: The email address the reset was requested for,
+        or None if the token is invalid, expired or not a reset token.
+    """
+    payload = decode_scoped_jwt(token, RESET_SCOPE)
+    return payload and payload.get("sub")
 
 
 def verify_change_email_token(token: str) -> dict | None:
@@ -139,13 +298,12 @@ def verify_change_email_token(token: str) -> dict | None:
 
     Returns:
         dict | None: A dictionary with 'old_email' and 'new_email'
-        if successful, or None if the token is invalid.
+        if successful, or None if the token is invalid or not an email change token.
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return {"old_email": payload.get("old_email"), "new_email": payload.get("new_email")}
-    except JWTError:
+    payload = decode_scoped_jwt(token, CHANGE_EMAIL_SCOPE)
+    if payload is None:
         return None
+    return {"old_email": payload.get("old_email"), "new_email": payload.get("new_email")}
 
 
 class CheckHTTPBearer(HTTPBearer):
@@ -0,0 +1,7 @@
+from cachetools import TTLCache
+
+from src.schemas.users import UserInDB
+
+# Per-process cache of users served by `GET /users/{user_id}`, keyed by user id.
+# Services that change a user row must drop its entry with `user_cache.pop(user_id, None)`.
+user_cache: TTLCache[int, UserInDB] = TTLCache(maxsize=10_000, ttl=60)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from sqlalchemy import insert, select, update, delete
+from sqlalchemy import bindparam, insert, select, update, delete
+from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.users import User
@@ -12,13 +13,17 @@ class AbstractRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_all(self):
+    async def find_all(self, limit: int | None = None, offset: int = 0):
         raise NotImplementedError
 
     @abstractmethod
     async def update_one(self, user_id: int, data: dict):
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_one_or_none(self, data: dict, **filter_by):
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_one(self, user_id: int):
         raise NotImplementedError
@@ -30,6 +35,12 @@ class AbstractRepository(ABC):
 class SQLAlchemyRepository(AbstractRepository):
     model = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Build the by-id delete once per repository so hot calls skip constructing it."""
+        super().__init_subclass__(**kwargs)
+        if cls.model is not None:
+            cls._delete_by_id = delete(cls.model).where(cls.model.id == bindparam("id"))
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -43,27 +54,48 @@ class SQLAlchemyRepository(AbstractRepository):
         res = await self.session.execute(stmt)
         return res.scalar_one()
 
+    async def update_one_or_none(self, data: dict, **filter_by) -> int | None:
+        """Update the row matching `filter_by` in a single round-trip and return its id, or None if none matched."""
+        stmt = update(self.model).values(**data).filter_by(**filter_by).returning(self.model.id)
+        res = await self.session.execute(stmt)
+        return res.scalar_one_or_none()
+
     async def delete_one(self, user_id: int) -> None:
-        stmt = delete(self.model).where(self.model.id == user_id)
-        await self.session.execute(stmt)
+        await self.session.execute(self._delete_by_id, {"id": user_id})
+
+    async def find_by_id(self, record_id: int):
+        """Return the row with this primary key, from the session's identity map when it is already loaded."""
+        return await self.session.get(self.model, record_id)
 
     async def find_one_or_none(self, **filter_by):
+        if filter_by.keys() == {"id"}:
+            return await self.find_by_id(filter_by["id"])
         stmt = select(self.model).filter_by(**filter_by)
         res = await self.session.execute(stmt)
         return res.scalar_one_or_none()
 
-    async def find_all(self):
-        stmt = select(self.model)
+    async def find_all(self, limit: int | None = None, offset: int = 0):
+        """Return rows ordered by id, one page at a time when `limit` is given; without it every row is loaded."""
+        stmt = select(self.model).order_by(self.model.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
         res = await self.session.execute(stmt)
         return res.scalars().all()
 
     async def find_one(self, **filter_by):
+        if filter_by.keys() == {"id"}:
+            row = await self.find_by_id(filter_by["id"])
+            if row is None:
+                raise NoResultFound("No row was found when one was required")
+            return row
         stmt = select(self.model).filter_by(**filter_by)
         res = await self.session.execute(stmt)
         return res.scalar_one()
 
     async def add_user(self, user: User) -> int:
-        async with self.session.begin():
-            self.session.add(user)
-            await self.session.flush()
-            return user.id
+        """Stage the user and flush to get its id; the unit of work commits it."""
+        self.session.add(user)
+        await self.session.flush()
+        return user.id
@@ -52,10 +52,6 @@ class UnitOfWork(ABCUnitOfWork):
             await self.session.commit()
         await self.session.close()
         logger.debug("Transaction ended.")
-        await logger.complete()
-
-        if exc:
-            raise exc
 
     async def commit(self):
         await self.session.commit()